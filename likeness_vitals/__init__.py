@@ -21,7 +21,7 @@ from importlib.metadata import PackageNotFoundError, version
 #     stacklevel=1,
 # )
 #
-from . import constants, sg_ops, vitals
+from . import constants, geoids, sg_ops, vitals
 from .constants import (
     BGID,
     BKID,
@@ -0,0 +1,218 @@
+"""Integer GEOID codec and hierarchy operations"""
+
+import numpy
+import pandas
+
+__author__ = "jGaboardi"
+
+
+__all__ = [
+    "LEVELS",
+    "child_bounds",
+    "decode",
+    "encode",
+    "is_within",
+    "parent",
+]
+
+# number of GEOID digits at each level of the Census hierarchy
+LEVELS = {
+    "state": 2,
+    "county": 5,
+    "tract": 11,
+    "block_group": 12,
+    "block": 15,
+}
+
+
+def encode(
+    geoids: numpy.ndarray | pandas.Series | list, level: None | str = None
+) -> numpy.ndarray | pandas.Series:
+    """Pack GEOID strings into ``int64``. Leading zeros are implied by
+    ``level``, so GEOIDs of a single level round trip with ``decode()``.
+
+    Parameters
+    ----------
+    geoids : numpy.ndarray | pandas.Series | list
+        GEOID strings (e.g., ``'010010201001000'``) of a single level.
+        Integer GEOIDs are validated and passed through.
+    level : None | str (default None)
+        Level of ``geoids`` -- see ``LEVELS``. If ``None``, the level is
+        inferred from the GEOID length (required for integer GEOIDs).
+
+    Returns
+    -------
+    ids : numpy.ndarray | pandas.Series
+        ``int64`` GEOIDs. A Series is returned for a Series input.
+    """
+
+    values = numpy.asarray(geoids)
+
+    if values.dtype.kind in "iu":
+        width = _width(level)
+        ids = values.astype(numpy.int64)
+        if ((ids < 0) | (ids >= 10**width)).any():
+            raise ValueError(f"GEOIDs out of range for ``{level}`` level.")
+        return _like(geoids, ids)
+
+    if not values.size:
+        return _like(geoids, numpy.empty(0, dtype=numpy.int64))
+
+    values = values.astype(str)
+    lengths = numpy.char.str_len(values)
+    if level is None:
+        level = _level(lengths.max())
+    width = _width(level)
+    if (lengths != width).any():
+        raise ValueError(f"GEOIDs must be {width} digits for ``{level}`` level.")
+
+    # digits -> weighted sum of powers of 10
+    digits = values.astype(f"S{width}").view(numpy.uint8).reshape(-1, width) - 48
+    if (digits > 9).any():
+        raise ValueError("GEOIDs must only contain digits.")
+    ids = digits.astype(numpy.int64) @ _powers(width)
+
+    return _like(geoids, ids)
+
+
+def decode(
+    ids: numpy.ndarray | pandas.Series | list, level: str
+) -> numpy.ndarray | pandas.Series:
+    """Unpack ``int64`` GEOIDs into zero-padded GEOID strings.
+
+    Parameters
+    ----------
+    ids : numpy.ndarray | pandas.Series | list
+        ``int64`` GEOIDs of a single level.
+    level : str
+        Level of ``ids`` -- see ``LEVELS``.
+
+    Returns
+    -------
+    geoids : numpy.ndarray | pandas.Series
+        GEOID strings (``object``). A Series is returned for a Series input.
+    """
+
+    width = _width(level)
+    values = numpy.asarray(ids, dtype=numpy.int64)
+
+    digits = (values[:, None] // _powers(width)) % 10 + 48
+    geoids = digits.astype(numpy.uint8).view(f"S{width}").ravel()
+
+    return _like(ids, geoids.astype(f"U{width}").astype(object))
+
+
+def parent(
+    ids: numpy.ndarray | pandas.Series, level: str, parent_level: str
+) -> numpy.ndarray | pandas.Series:
+    """Truncate ``int64`` GEOIDs to a parent level (e.g., block to block
+    group) with integer division.
+
+    Parameters
+    ----------
+    ids : numpy.ndarray | pandas.Series
+        ``int64`` GEOIDs.
+    level : str
+        Level of ``ids`` -- see ``LEVELS``.
+    parent_level : str
+        Level of the parent GEOIDs.
+
+    Returns
+    -------
+    numpy.ndarray | pandas.Series
+        ``int64`` parent GEOIDs.
+    """
+
+    return ids // 10 ** _depth(parent_level, level)
+
+
+def child_bounds(
+    ids: numpy.ndarray | pandas.Series, level: str, child_level: str
+) -> tuple[numpy.ndarray | pandas.Series, numpy.ndarray | pandas.Series]:
+    """Half-open range of ``int64`` child GEOIDs (e.g., blocks of a block
+    group) for range selection or ``searchsorted`` over sorted children.
+
+    Parameters
+    ----------
+    ids : numpy.ndarray | pandas.Series
+        ``int64`` GEOIDs.
+    level : str
+        Level of ``ids`` -- see ``LEVELS``.
+    child_level : str
+        Level of the child GEOIDs.
+
+    Returns
+    -------
+    lower : numpy.ndarray | pandas.Series
+        First possible child GEOID (inclusive).
+    upper : numpy.ndarray | pandas.Series
+        Last possible child GEOID (exclusive).
+    """
+
+    scale = 10 ** _depth(level, child_level)
+    return ids * scale, (ids + 1) * scale
+
+
+def is_within(
+    ids: numpy.ndarray | pandas.Series,
+    level: str,
+    parent_ids: numpy.ndarray | pandas.Series | int,
+    parent_level: str,
+) -> numpy.ndarray | pandas.Series:
+    """Whether ``int64`` GEOIDs fall within parent GEOIDs.
+
+    Parameters
+    ----------
+    ids : numpy.ndarray | pandas.Series
+        ``int64`` GEOIDs.
+    level : str
+        Level of ``ids`` -- see ``LEVELS``.
+    parent_ids : numpy.ndarray | pandas.Series | int
+        ``int64`` parent GEOIDs -- either a single GEOID or one per ``ids``.
+    parent_level : str
+        Level of ``parent_ids``.
+
+    Returns
+    -------
+    numpy.ndarray | pandas.Series
+        Boolean membership.
+    """
+
+    return parent(ids, level, parent_level) == parent_ids
+
+
+def _width(level: str) -> int:
+    """Number of GEOID digits at ``level``."""
+    if level not in LEVELS:
+        raise ValueError(f"``level`` must be one of {tuple(LEVELS)}: {level}.")
+    return LEVELS[level]
+
+
+def _level(width: int) -> str:
+    """Level with GEOIDs of ``width`` digits."""
+    for level, _width_ in LEVELS.items():
+        if _width_ == width:
+            return level
+    raise ValueError(f"No GEOID level with {width} digits.")
+
+
+def _depth(level: str, child_level: str) -> int:
+    """Number of GEOID digits between ``level`` and a lower ``child_level``."""
+    depth = _width(child_level) - _width(level)
+    if depth < 0:
+        raise ValueError(f"``{child_level}`` is not below ``{level}``.")
+    return depth
+
+
+def _powers(width: int) -> numpy.ndarray:
+    """Place values of ``width`` digits, most significant first."""
+    return 10 ** numpy.arange(width - 1, -1, -1, dtype=numpy.int64)
+
+
+def _like(
+    x: numpy.ndarray | pandas.Series | list, values: numpy.ndarray
+) -> numpy.ndarray | pandas.Series:
+    """Values as a Series if ``x`` is a Series."""
+    if isinstance(x, pandas.Series):
+        return pandas.Series(values, index=x.index, name=x.name)
+    return values
@@ -1,3 +1,8 @@
+import json
+import logging
+import pickle
+
+import numpy
 import pandas
 import pytest
 
@@ -23,12 +28,315 @@ class TestMatch:
         observed = likeness_vitals.vitals.match(self.a1, self.b2, on="id").tolist()
         assert observed == known
 
+    def test_match_missing(self):
+        known = [1.0, 2.0, numpy.nan]
+        x1 = pandas.DataFrame({"id": ["A", "B", "D"]}, index=[7, 8, 9])
+        observed = likeness_vitals.vitals.match(x1, self.b1, on="id")
+        numpy.testing.assert_array_equal(observed, known)
+        assert observed.index.equals(x1.index)
+
+    def test_match_duplicates_last(self):
+        known = [4, 4, 4, 2, 3, 3]
+        b1 = pandas.concat([self.b1, pandas.DataFrame({"id": ["A"], "val": [4]})])
+        observed = likeness_vitals.vitals.match(self.a1, b1, on="id").tolist()
+        assert observed == known
+
+    def test_match_index(self):
+        known = pandas.Index([1, 1, 1, 2, 3, 3], name="id")
+        observed = likeness_vitals.vitals.match(self.a1.set_index("id"), self.b2)
+        pandas.testing.assert_index_equal(observed, known)
+
     def test_match_df_type_error(self):
         x2 = "two"
         with pytest.raises(TypeError, match=f"{type(x2)} not supported for ``x2``."):
             likeness_vitals.vitals.match("one", x2)
 
 
+class TestMatcher:
+    def setup_method(self):
+        self.a1 = pandas.DataFrame({"id": ["A", "A", "A", "B", "C", "C"]})
+        self.a2 = pandas.DataFrame({"id": ["C", "D"]})
+        self.b1 = pandas.DataFrame(
+            {"id": ["A", "B", "C", "A"], "val": [1, 2, 3, 4], "lab": list("wxyz")}
+        )
+        self.matcher = likeness_vitals.vitals.Matcher(self.b1, on="id")
+
+    def test_matcher(self):
+        known = [4, 4, 4, 2, 3, 3]
+        observed = self.matcher(self.a1).tolist()
+        assert observed == known
+
+    def test_matcher_v(self):
+        known = ["y", numpy.nan]
+        observed = self.matcher(self.a2, v="lab").tolist()
+        assert observed == known
+
+    def test_matcher_equals_match(self):
+        known = likeness_vitals.vitals.match(self.a1, self.b1, on="id", v="lab")
+        observed = self.matcher(self.a1, v="lab")
+        pandas.testing.assert_series_equal(observed, known)
+
+    def test_matcher_pickle(self):
+        matcher = pickle.loads(pickle.dumps(self.matcher))
+        known = self.matcher(self.a1)
+        observed = matcher(self.a1)
+        pandas.testing.assert_series_equal(observed, known)
+
+
+class TestMatchMulti:
+    def setup_method(self):
+        self.a1 = pandas.DataFrame(
+            {"id": ["A", "A", "B", "C"], "yr": [2020, 2021, 2020, 2020]},
+            index=[5, 6, 7, 8],
+        )
+        self.b1 = pandas.DataFrame(
+            {
+                "id": ["A", "A", "B"],
+                "yr": [2020, 2021, 2020],
+                "val": [1, 2, 3],
+                "lab": ["x", "y", "z"],
+            }
+        )
+
+    def test_multi_v(self):
+        known = pandas.DataFrame(
+            {"val": [2, 2, 3, numpy.nan], "lab": ["y", "y", "z", numpy.nan]},
+            index=[5, 6, 7, 8],
+        )
+        # duplicate ``A`` keys keep the last value
+        observed = likeness_vitals.vitals.match(
+            self.a1, self.b1.drop(columns="yr"), on="id", v=["val", "lab"]
+        )
+        pandas.testing.assert_frame_equal(observed, known, check_dtype=False)
+
+    def test_composite_on(self):
+        known = [1.0, 2.0, 3.0, numpy.nan]
+        observed = likeness_vitals.vitals.match(self.a1, self.b1, on=["id", "yr"])
+        numpy.testing.assert_array_equal(observed, known)
+        assert observed.index.equals(self.a1.index)
+
+    def test_composite_on_multi_v(self):
+        known = pandas.DataFrame(
+            {"lab": ["x", "y", "z", numpy.nan], "val": [1, 2, 3, numpy.nan]},
+            index=[5, 6, 7, 8],
+        )
+        observed = likeness_vitals.vitals.match(
+            self.a1, self.b1, on=["id", "yr"], v=["lab", "val"]
+        )
+        pandas.testing.assert_frame_equal(observed, known, check_dtype=False)
+
+
+class TestMatchDuplicates:
+    def setup_method(self):
+        self.a1 = pandas.DataFrame({"id": ["A", "B", "C", "D"]})
+        self.b1 = pandas.DataFrame(
+            {"id": ["A", "B", "A", "C"], "val": [1, 2, 3, 4], "wgt": [1, 1, 1, 1]}
+        )
+
+    def test_duplicates_first(self):
+        known = [1, 2, 4, numpy.nan]
+        observed = likeness_vitals.vitals.match(
+            self.a1, self.b1, on="id", duplicates="first"
+        )
+        numpy.testing.assert_array_equal(observed, known)
+
+    def test_duplicates_aggregate(self):
+        known = pandas.DataFrame(
+            {"val": [4, 2, 4, numpy.nan], "wgt": [2, 1, 1, numpy.nan]}
+        )
+        observed = likeness_vitals.vitals.match(
+            self.a1, self.b1, on="id", v=["val", "wgt"], duplicates="aggregate"
+        )
+        pandas.testing.assert_frame_equal(observed, known, check_dtype=False)
+
+    def test_duplicates_aggregate_series(self):
+        known = [2, 2, 4, numpy.nan]
+        observed = likeness_vitals.vitals.match(
+            self.a1,
+            self.b1.set_index("id")["val"],
+            on="id",
+            duplicates="aggregate",
+            aggfunc="mean",
+        )
+        numpy.testing.assert_array_equal(observed, known)
+
+    def test_duplicates_error(self):
+        with pytest.raises(ValueError, match="Duplicate keys found in ``x2``: "):
+            likeness_vitals.vitals.match(self.a1, self.b1, on="id", duplicates="error")
+
+    def test_duplicates_policy_error(self):
+        with pytest.raises(ValueError, match="``duplicates`` must be one of"):
+            likeness_vitals.vitals.match(self.a1, self.b1, on="id", duplicates="x")
+
+    def test_return_unmatched(self):
+        known = 1
+        _, observed = likeness_vitals.vitals.match(
+            self.a1, self.b1, on="id", return_unmatched=True
+        )
+        assert observed == known
+
+
+class TestTimingRegistry:
+    def setup_method(self):
+        self.registry = likeness_vitals.vitals.TimingRegistry(buffer_size=2)
+
+        @likeness_vitals.vitals.function_timer(name="square", registry=self.registry)
+        def square(x):
+            return x**2
+
+        self.square = square
+        for i in range(5):
+            self.square(i)
+
+    def test_summary(self):
+        summary = self.registry.summary()
+        known = ["square"]
+        observed = summary.index.tolist()
+        assert known == observed
+
+        known = 5
+        observed = summary.loc["square", "count"]
+        assert known == observed
+
+        stats = summary.loc["square"]
+        assert stats["min"] <= stats["p50"] <= stats["p99"] <= stats["max"]
+        assert stats["total"] == pytest.approx(stats["mean"] * 5)
+
+    def test_percentile_bounds(self):
+        registry = likeness_vitals.vitals.TimingRegistry(percentiles=(0, 100))
+        for elapsed_ns in (1_000, 2_000, 3_000):
+            registry.record("f", elapsed_ns)
+        stats = registry.summary().loc["f"]
+        known = [1e-6, 3e-6]
+        observed = [stats["p0"], stats["p100"]]
+        assert known == pytest.approx(observed)
+
+    def test_percentiles_error(self):
+        with pytest.raises(ValueError, match="``percentiles`` must be in"):
+            likeness_vitals.vitals.TimingRegistry(percentiles=(50, 101))
+
+    def test_export(self, tmp_path):
+        known = {"square"}
+        observed = set(json.loads(self.registry.to_json()))
+        assert known == observed
+
+        self.registry.to_csv(tmp_path / "timings.csv")
+        observed = pandas.read_csv(tmp_path / "timings.csv", index_col="function")
+        pandas.testing.assert_frame_equal(
+            self.registry.summary(), observed, check_dtype=False
+        )
+
+    def test_log(self, caplog):
+        with caplog.at_level(logging.INFO, logger="likeness_vitals.vitals"):
+            self.registry.log()
+        assert "timing square count=5 " in caplog.text
+
+    def test_reset(self):
+        self.registry.reset()
+        self.square(2)
+        known = 1
+        observed = self.registry.summary().loc["square", "count"]
+        assert known == observed
+
+    def test_verbose(self, capsys):
+        @likeness_vitals.vitals.function_timer(verbose=True, registry=self.registry)
+        def cube(x):
+            return x**3
+
+        known = 8
+        observed = cube(2)
+        assert known == observed
+        assert "min. -- ``cube()``" in capsys.readouterr().out
+
+
+class TestSpan:
+    def setup_method(self):
+        self.tracer = likeness_vitals.vitals.Tracer()
+
+        @likeness_vitals.vitals.span(tracer=self.tracer)
+        def stage(n):
+            return n
+
+        with likeness_vitals.vitals.span(
+            "outer", rows=10, tracer=self.tracer, method="x"
+        ) as outer:
+            stage(1)
+            with likeness_vitals.vitals.span("inner", tracer=self.tracer) as inner:
+                inner.rows = 5
+        self.outer = outer
+
+    def test_nesting(self):
+        spans = self.tracer.to_frame().set_index("name")
+        known = [self.outer.span_id, self.outer.span_id]
+        observed = spans["parent_id"].drop("outer").tolist()
+        assert known == observed
+        assert pandas.isna(spans.loc["outer", "parent_id"])
+
+        outer = spans.loc["outer"]
+        children = spans.drop("outer")
+        assert (children["duration"] <= outer["duration"]).all()
+        assert (children["start"] >= outer["start"]).all()
+
+    def test_rows_args(self):
+        spans = self.tracer.to_frame().set_index("name")
+        known = [10, 5, {"method": "x"}]
+        observed = [
+            spans.loc["outer", "rows"],
+            spans.loc["inner", "rows"],
+            spans.loc["outer", "args"],
+        ]
+        assert known == observed
+
+    def test_decorator_name(self):
+        known = "TestSpan.setup_method.<locals>.stage"
+        observed = self.tracer.to_frame()["name"].iloc[0].split(".", 1)[1]
+        assert known == observed
+
+    def test_bare_decorator(self, monkeypatch):
+        monkeypatch.setattr(likeness_vitals.vitals, "tracer", self.tracer)
+
+        @likeness_vitals.vitals.span
+        def stage():
+            return 2
+
+        known = 2
+        observed = stage()
+        assert known == observed
+        assert self.tracer.to_frame()["name"].iloc[-1].endswith("stage")
+
+    def test_error(self):
+        with (
+            pytest.raises(ZeroDivisionError),
+            likeness_vitals.vitals.span("boom", tracer=self.tracer),
+        ):
+            1 / 0  # noqa: B018
+        known = {"error": "ZeroDivisionError"}
+        observed = self.tracer.to_frame()["args"].iloc[-1]
+        assert known == observed
+
+    def test_chrome_trace(self, tmp_path):
+        self.tracer.to_chrome_trace(tmp_path / "trace.json")
+        trace = json.loads((tmp_path / "trace.json").read_text())
+        events = trace["traceEvents"]
+
+        known = ["X", "X", "X"]
+        observed = [e["ph"] for e in events]
+        assert known == observed
+
+        known = {"span_id": self.outer.span_id, "parent_id": None}
+        known.update({"rows": 10, "method": "x"})
+        observed = events[-1]["args"]
+        assert known == observed
+
+    def test_disabled(self):
+        tracer = likeness_vitals.vitals.Tracer(enabled=False)
+        with likeness_vitals.vitals.span("off", tracer=tracer):
+            pass
+        known = 0
+        observed = len(tracer)
+        assert known == observed
+
+
 @pytest.xdist_group_1
 def test_vitals_function_timer():
     known = 3
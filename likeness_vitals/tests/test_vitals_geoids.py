@@ -0,0 +1,87 @@
+import numpy
+import pandas
+import pytest
+
+import likeness_vitals
+
+bkids = ["010010201001000", "010010201002013", "060750101001005"]
+
+
+class TestGeoidsCodec:
+    def test_encode(self):
+        known = numpy.array([10010201001000, 10010201002013, 60750101001005])
+        observed = likeness_vitals.geoids.encode(bkids)
+        numpy.testing.assert_array_equal(known, observed)
+        assert observed.dtype == numpy.int64
+
+    def test_roundtrip_series(self):
+        known = pandas.Series(bkids, index=[9, 8, 7], name="bkid", dtype=object)
+        observed = likeness_vitals.geoids.decode(
+            likeness_vitals.geoids.encode(known, level="block"), "block"
+        )
+        pandas.testing.assert_series_equal(known, observed, check_dtype=False)
+
+    def test_encode_ints(self):
+        known = numpy.array([1001, 6075])
+        observed = likeness_vitals.geoids.encode([1001, 6075], level="county")
+        numpy.testing.assert_array_equal(known, observed)
+
+    def test_encode_empty(self):
+        known = 0
+        observed = likeness_vitals.geoids.encode([]).size
+        assert known == observed
+
+    @pytest.mark.parametrize(
+        "geoids, level, msg",
+        [
+            (["01001", "0100"], None, "GEOIDs must be 5 digits for ``county``"),
+            (["0100A"], None, "GEOIDs must only contain digits."),
+            (["0100"], None, "No GEOID level with 4 digits."),
+            (["01001"], "place", "``level`` must be one of"),
+            ([100001], "county", "GEOIDs out of range for ``county`` level."),
+        ],
+    )
+    def test_encode_errors(self, geoids, level, msg):
+        with pytest.raises(ValueError, match=msg):
+            likeness_vitals.geoids.encode(geoids, level=level)
+
+
+class TestGeoidsHierarchy:
+    def setup_method(self):
+        self.ids = likeness_vitals.geoids.encode(bkids)
+
+    @pytest.mark.parametrize(
+        "parent_level, known",
+        [
+            ("block_group", ["010010201001", "010010201002", "060750101001"]),
+            ("tract", ["01001020100", "01001020100", "06075010100"]),
+            ("county", ["01001", "01001", "06075"]),
+            ("state", ["01", "01", "06"]),
+        ],
+    )
+    def test_parent(self, parent_level, known):
+        observed = likeness_vitals.geoids.decode(
+            likeness_vitals.geoids.parent(self.ids, "block", parent_level),
+            parent_level,
+        ).tolist()
+        assert known == observed
+
+    def test_parent_error(self):
+        with pytest.raises(ValueError, match="``tract`` is not below ``block``."):
+            likeness_vitals.geoids.parent(self.ids, "tract", "block")
+
+    def test_child_bounds(self):
+        tracts = likeness_vitals.geoids.encode(["01001020100", "06075010100"])
+        lower, upper = likeness_vitals.geoids.child_bounds(tracts, "tract", "block")
+        known = [2, 1]
+        observed = (
+            numpy.searchsorted(self.ids, upper) - numpy.searchsorted(self.ids, lower)
+        ).tolist()
+        assert known == observed
+
+    def test_is_within(self):
+        known = [True, True, False]
+        observed = likeness_vitals.geoids.is_within(
+            self.ids, "block", 1001, "county"
+        ).tolist()
+        assert known == observed
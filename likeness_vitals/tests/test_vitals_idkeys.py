@@ -1,3 +1,5 @@
+import uuid
+
 import numpy
 import pandas
 import pytest
@@ -45,6 +47,62 @@ class TestVitalsUUID:
         observed = len(set(df.index))
         assert known == observed
 
+    @pytest.mark.parametrize("uuid_version", [1, 4, 7])
+    def test_version(self, df, uuid_version):
+        """UUID versions"""
+        _df = likeness_vitals.vitals.create_uid(df, "uuid", uuid_version=uuid_version)
+        known = [uuid_version] * 3
+        observed = [uuid.UUID(u).version for u in _df["uuid"]]
+        assert known == observed
+
+        known = [uuid.RFC_4122] * 3
+        observed = [uuid.UUID(u).variant for u in _df["uuid"]]
+        assert known == observed
+
+    def test_seed(self, df):
+        """reproducible UUIDs"""
+        known = likeness_vitals.vitals.create_uid(df.copy(), "uuid", seed=5)["uuid"]
+        observed = likeness_vitals.vitals.create_uid(df, "uuid", seed=5)["uuid"]
+        pandas.testing.assert_series_equal(known, observed)
+
+    def test_seed_v7(self, df):
+        """version 7 UUIDs share seeded random bytes, not timestamps"""
+        known = likeness_vitals.vitals.create_uid(
+            df.copy(), "uuid", uuid_version=7, seed=5
+        )["uuid"]
+        observed = likeness_vitals.vitals.create_uid(
+            df, "uuid", uuid_version=7, seed=5
+        )["uuid"]
+        assert known.str[12:].tolist() == observed.str[12:].tolist()
+
+    def test_binary(self, df):
+        """UUIDs as 16-byte binary"""
+        _df = likeness_vitals.vitals.create_uid(df, "uuid", seed=5, binary=True)
+        _hex = likeness_vitals.vitals.create_uid(df.copy(), "uuid", seed=5)["uuid"]
+        known = _hex.tolist()
+        observed = [uuid.UUID(bytes=_df["uuid"].iloc[ix]).hex for ix in range(3)]
+        assert known == observed
+
+    def test_binary_trailing_null(self):
+        """all 16 bytes are kept (~1 in 256 UUIDs end in a null byte)"""
+        df = pandas.DataFrame({"c1": range(5_000)})
+        _df = likeness_vitals.vitals.create_uid(df, "uuid", seed=1, binary=True)
+        known = {16}
+        observed = {len(_df["uuid"].iloc[ix]) for ix in range(_df.shape[0])}
+        assert known == observed
+        assert _df["uuid"].map(lambda b: b.endswith(b"\x00")).any()
+
+    def test_version_error(self, df):
+        """unsupported UUID version"""
+        with pytest.raises(ValueError, match="``uuid_version`` must be one of"):
+            likeness_vitals.vitals.create_uid(df, "uuid", uuid_version=3)
+
+    @pytest.mark.parametrize("kwargs", [{"seed": 5}, {"binary": True}])
+    def test_version_1_error(self, df, kwargs):
+        """unsupported options of version 1 UUIDs"""
+        with pytest.raises(ValueError, match="not supported for ``uuid_version=1``"):
+            likeness_vitals.vitals.create_uid(df, "uuid", uuid_version=1, **kwargs)
+
 
 class TestVitalsNonUUID:
     def test_1col(self, df):
@@ -164,6 +222,119 @@ class TestVitalsNonUUID:
         observed = _df
         numpy.testing.assert_array_equal(known, observed)
 
+    def test_3col_missing_datetime(self, df):
+        """multiple columns; missing & datetime values"""
+        df["c2"] = ["x", None, "y"]
+        df["dt"] = pandas.to_datetime(["2020-01-01"] * 3)
+        _df = likeness_vitals.vitals.create_uid(
+            df, "id1", from_columns=["c1", "c2", "dt"]
+        )
+        known = [
+            "A_x_2020-01-01 00:00:00",
+            "B_nan_2020-01-01 00:00:00",
+            "C_y_2020-01-01 00:00:00",
+        ]
+        observed = _df["id1"].tolist()
+        assert known == observed
+
+    def test_2col_idx_duplicate_labels(self, df):
+        """multiple columns; use index; duplicate index labels"""
+        df.index = [999, 999, 997]
+        _df = likeness_vitals.vitals.create_uid(
+            df, "id1", use_index=True, from_columns=["c1", "vals"]
+        )
+        known = ["A_10_999", "B_20_999", "C_30_997"]
+        observed = _df["id1"].tolist()
+        assert known == observed
+
+        known = [999, 999, 997]
+        observed = _df.index.tolist()
+        assert known == observed
+
+    @pytest.mark.parametrize("hash_bits, dtype", [(64, "uint64"), (128, "O")])
+    def test_hash(self, df, hash_bits, dtype):
+        """content-hash IDs; stable across reruns"""
+        df.loc[997, ["c1", "c2"]] = ["A", "x"]
+        _df = likeness_vitals.vitals.create_uid(
+            df.copy(), "id1", from_columns=["c1", "c2"], hash_bits=hash_bits
+        )
+        known = numpy.dtype(dtype)
+        observed = _df["id1"].dtype
+        assert known == observed
+
+        known = [2, True]
+        observed = [_df["id1"].nunique(), _df["id1"].iloc[0] == _df["id1"].iloc[2]]
+        assert known == observed
+
+        known = _df["id1"]
+        observed = likeness_vitals.vitals.create_uid(
+            df, "id1", from_columns=["c1", "c2"], hash_bits=hash_bits
+        )["id1"]
+        pandas.testing.assert_series_equal(known, observed)
+
+    def test_hash_128_bytes(self):
+        """all 16 bytes are kept (~1 in 256 hashes end in a null byte)"""
+        df = pandas.DataFrame({"c1": range(5_000)})
+        _df = likeness_vitals.vitals.create_uid(
+            df, "id1", from_columns="c1", hash_bits=128
+        )
+        known = {16}
+        observed = {len(_df["id1"].iloc[ix]) for ix in range(_df.shape[0])}
+        assert known == observed
+        assert _df["id1"].map(lambda b: b.endswith(b"\x00")).any()
+
+    @pytest.mark.parametrize("use_index", [False, True])
+    def test_hash_128_halves(self, use_index):
+        """both 64-bit halves are hashed separately for numeric columns"""
+        df = pandas.DataFrame({"c1": [1, 2, 3], "c2": [1.5, 2.5, 3.5]})
+        _df = likeness_vitals.vitals.create_uid(
+            df, "id1", use_index=use_index, from_columns=["c1", "c2"], hash_bits=128
+        )
+        observed = [ix[:8] != ix[8:] for ix in _df["id1"]]
+        assert all(observed)
+
+    def test_hash_idx(self, df):
+        """content-hash IDs; use index"""
+        df.loc[997, ["c1", "c2"]] = ["A", "x"]
+        _df = likeness_vitals.vitals.create_uid(
+            df, "id1", use_index=True, from_columns=["c1", "c2"], hash_bits=64
+        )
+        known = 3
+        observed = _df["id1"].nunique()
+        assert known == observed
+
+    @pytest.mark.parametrize("hash_bits", likeness_vitals.vitals.HASH_BITS)
+    @pytest.mark.parametrize("dtype", ["string", "boolean"])
+    def test_hash_nullable(self, hash_bits, dtype):
+        """content-hash IDs of nullable (``pandas.NA``) columns"""
+        values = {"string": ["x", None, "x"], "boolean": [True, None, True]}[dtype]
+        df = pandas.DataFrame({"c1": pandas.array(values, dtype=dtype)})
+        _df = likeness_vitals.vitals.create_uid(
+            df, "id1", from_columns="c1", hash_bits=hash_bits
+        )
+        known = [2, True]
+        observed = [_df["id1"].nunique(), _df["id1"].iloc[0] == _df["id1"].iloc[2]]
+        assert known == observed
+
+    def test_hash_collision_error(self, df, monkeypatch):
+        """differing rows with the same content-hash"""
+        monkeypatch.setattr(
+            pandas.util,
+            "hash_pandas_object",
+            lambda df, **_: pandas.Series(numpy.zeros(len(df), dtype="uint64")),
+        )
+        with pytest.raises(ValueError, match="Row hash collision detected"):
+            likeness_vitals.vitals.create_uid(
+                df, "id1", from_columns="c1", hash_bits=64
+            )
+
+    def test_hash_bits_error(self, df):
+        """unsupported hash size"""
+        with pytest.raises(ValueError, match="``hash_bits`` must be one of"):
+            likeness_vitals.vitals.create_uid(
+                df, "id1", from_columns="c1", hash_bits=32
+            )
+
     def test_conflicting_kwargs_error(self, df):
         """conflicting keyword argument combination"""
         set_index = False
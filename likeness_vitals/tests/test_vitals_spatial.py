@@ -1,6 +1,11 @@
+import concurrent.futures
+
 import geopandas
+import geopandas.testing
+import numpy
 import pandas
 import pytest
+import scipy
 import shapely
 
 import likeness_vitals
@@ -8,6 +13,7 @@ import likeness_vitals
 gid = likeness_vitals.constants.GID
 pid = likeness_vitals.constants.PID
 cnt = likeness_vitals.constants.CNT
+trs = likeness_vitals.constants.TRS
 
 
 def _pnt_df() -> pandas.DataFrame:
@@ -50,6 +56,42 @@ def plg_cent_df() -> geopandas.GeoDataFrame:
     return _plg_df().pipe(lambda df: df.assign(**{"geometry": df.geometry.centroid}))
 
 
+class TestVitalsIntegerize:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, pnt_df):
+        self.df = pnt_df.assign(w=[0.4, 1.5, 2.3, 0.9, 0.9, 0.9])
+        self.trs_df = likeness_vitals.sg_ops.integerize(self.df, "w", gid, seed=1)
+
+    def test_integer(self):
+        observed = self.trs_df[trs]
+        assert observed.dtype == numpy.int64
+        assert (observed >= numpy.floor(self.df["w"])).all()
+        assert (observed <= numpy.ceil(self.df["w"])).all()
+
+    def test_group_totals(self):
+        known = [4, 3]
+        observed = self.trs_df.groupby(gid)[trs].sum().tolist()
+        assert observed == known
+
+    def test_total(self):
+        known = 7
+        observed = likeness_vitals.sg_ops.integerize(self.df, "w")[trs].sum()
+        assert observed == known
+
+    def test_reproducible(self):
+        observed = likeness_vitals.sg_ops.integerize(self.df, "w", gid, seed=1)
+        pandas.testing.assert_frame_equal(observed, self.trs_df)
+
+    def test_disaggregate(self):
+        known = 7
+        observed = likeness_vitals.sg_ops.disaggregate(self.trs_df, trs).shape[0]
+        assert observed == known
+
+    def test_negative_error(self):
+        with pytest.raises(ValueError, match="``w`` must be non-negative"):
+            likeness_vitals.sg_ops.integerize(self.df.assign(w=-1), "w")
+
+
 class TestVitalsDisAggLocs:
     @pytest.fixture(autouse=True)
     def setup_method(self, pnt_df_cnt):
@@ -73,6 +115,167 @@ class TestVitalsDisAggLocs:
         assert observed == known
 
 
+class TestVitalsDisAggIDs:
+    def test_ids(self, pnt_df_cnt):
+        known = ["p10-0", "p11-1", "p11-2", "p12-3", "p12-4", "p12-5"]
+        observed = likeness_vitals.sg_ops.disaggregate(pnt_df_cnt, cnt, id_col=pid)
+        assert observed[pid].tolist()[:6] == known
+        assert observed[pid].is_unique
+
+    def test_compact_ids(self, pnt_df_cnt):
+        known = likeness_vitals.sg_ops.disaggregate(pnt_df_cnt, cnt, id_col=pid)
+        observed = likeness_vitals.sg_ops.disaggregate(
+            pnt_df_cnt, cnt, id_col=pid, compact_ids=True
+        )
+        assert isinstance(observed[pid].dtype, pandas.CategoricalDtype)
+        assert observed[pid].tolist()[:3] == ["p10", "p11", "p11"]
+        assert observed.columns.equals(known.columns)
+        observed = likeness_vitals.sg_ops.expand_ids(observed, pid)
+        assert observed.tolist() == known[pid].tolist()
+
+    def test_ids_chunked(self, pnt_df_cnt, monkeypatch):
+        monkeypatch.setattr(likeness_vitals.sg_ops, "_ID_CHUNKSIZE", 4)
+        df = pnt_df_cnt.assign(**{pid: ["p10", None, "p12", "p13", "p14", "p15"]})
+        observed = likeness_vitals.sg_ops.disaggregate(df, cnt, id_col=pid)
+        bases = ["p10"] + [None] * 2 + ["p12"] * 3 + ["p13"] + ["p14"] * 2
+        bases += ["p15"] * 3
+        known = [f"{b}-{ix}" if b else None for ix, b in enumerate(bases)]
+        assert observed[pid].isna().tolist() == [k is None for k in known]
+        assert observed[pid].dropna().tolist() == [k for k in known if k]
+
+
+class TestVitalsDisAggLazy:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, pnt_df_cnt):
+        self.known = likeness_vitals.sg_ops.disaggregate(pnt_df_cnt, cnt, id_col=pid)
+        self.view = likeness_vitals.sg_ops.disaggregate(
+            pnt_df_cnt, cnt, id_col=pid, lazy=True
+        )
+
+    def test_view(self, pnt_df_cnt):
+        assert isinstance(self.view, likeness_vitals.sg_ops.DisaggregatedView)
+        assert self.view.obj is pnt_df_cnt
+        assert self.view.shape == self.known.shape
+
+    def test_to_frame(self):
+        pandas.testing.assert_frame_equal(self.view.to_frame(), self.known)
+
+    @pytest.mark.parametrize("col", [gid, pid, cnt])
+    def test_getitem(self, col):
+        pandas.testing.assert_series_equal(self.view[col], self.known[col])
+
+    def test_take(self):
+        rows = numpy.array([11, 3, 4])
+        known = self.known.take(rows)
+        pandas.testing.assert_frame_equal(self.view.take(rows), known)
+
+    def test_synthetic_locations(self, plg_df):
+        known = likeness_vitals.sg_ops.synthetic_locations(self.known, plg_df, gid)
+        observed = likeness_vitals.sg_ops.synthetic_locations(self.view, plg_df, gid)
+        geopandas.testing.assert_geodataframe_equal(observed, known)
+
+    def test_match(self):
+        x2 = pandas.Series([1, 2], index=["A", "B"])
+        known = likeness_vitals.vitals.match(self.known, x2, on=gid)
+        observed = likeness_vitals.vitals.match(self.view, x2, on=gid)
+        pandas.testing.assert_series_equal(observed, known)
+
+
+class TestVitalsIterDisAgg:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, pnt_df_cnt):
+        self.df = pnt_df_cnt.assign(**{cnt: [1, 0, 3, 7, 1, 2]})
+        self.known = likeness_vitals.sg_ops.disaggregate(self.df, cnt, id_col=pid)
+
+    @pytest.mark.parametrize(
+        "chunksize, sizes",
+        [(1, [1] * 14), (4, [4, 4, 4, 2]), (5, [5, 5, 4]), (20, [14])],
+    )
+    def test_chunks(self, chunksize, sizes):
+        chunks = list(
+            likeness_vitals.sg_ops.iter_disaggregate(
+                self.df, cnt, id_col=pid, chunksize=chunksize
+            )
+        )
+        assert [chunk.shape[0] for chunk in chunks] == sizes
+        pandas.testing.assert_frame_equal(pandas.concat(chunks), self.known)
+
+    def test_chunksize_error(self):
+        with pytest.raises(ValueError, match="``chunksize`` must be 1 or greater"):
+            next(likeness_vitals.sg_ops.iter_disaggregate(self.df, cnt, chunksize=0))
+
+
+class TestVitalsReAgg:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, pnt_df_cnt):
+        self.df = pnt_df_cnt.assign(attr=[1, 2, 1, 2, 1, 2])
+        self.disagg_df = likeness_vitals.sg_ops.disaggregate(self.df, cnt, id_col=pid)
+
+    def test_counts(self):
+        known = pandas.DataFrame(
+            {gid: ["A", "A", "B", "B"], "attr": [1, 2, 2, 1], cnt: [4, 2, 4, 2]}
+        )
+        observed = likeness_vitals.sg_ops.reaggregate(
+            self.disagg_df, cnt, columns=[gid, "attr"]
+        )
+        pandas.testing.assert_frame_equal(observed, known)
+
+    def test_roundtrip(self):
+        known = self.df.drop(columns=pid)
+        observed = likeness_vitals.sg_ops.reaggregate(
+            likeness_vitals.sg_ops.disaggregate(known, cnt), cnt
+        )
+        pandas.testing.assert_frame_equal(
+            observed.groupby([gid, "attr"]).sum(), known.groupby([gid, "attr"]).sum()
+        )
+
+    def test_collision_error(self, monkeypatch):
+        monkeypatch.setattr(
+            pandas.util,
+            "hash_pandas_object",
+            lambda df, **_: pandas.Series(numpy.zeros(len(df), dtype="uint64")),
+        )
+        with pytest.raises(ValueError, match="Row hash collision detected"):
+            likeness_vitals.sg_ops.reaggregate(self.disagg_df, cnt, columns=[gid])
+
+    @pytest.mark.parametrize("dtype", ["string", "boolean", "Int64"])
+    def test_nullable(self, dtype):
+        values = {"string": ["x", None, "x"], "boolean": [True, None, True]}
+        values = pandas.array(values.get(dtype, [1, None, 1]), dtype=dtype)
+        observed = likeness_vitals.sg_ops.reaggregate(
+            pandas.DataFrame({"attr": values}), cnt
+        )
+        assert observed[cnt].tolist() == [2, 1]
+        assert observed["attr"].isna().tolist() == [False, True]
+
+
+class TestVitalsDisAggDtypes:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, pnt_df_cnt, plg_cent_df):
+        self.df = pnt_df_cnt.assign(
+            cat=pandas.Categorical(list("xyzxyz")),
+            num=numpy.arange(6, dtype="int32"),
+            geometry=plg_cent_df.geometry.loc[pnt_df_cnt[gid]].values,
+        ).pipe(geopandas.GeoDataFrame)
+        self.disagg_df = likeness_vitals.sg_ops.disaggregate(self.df, cnt, id_col=pid)
+
+    def test_dtypes(self):
+        known = self.df.dtypes.drop(pid)
+        observed = self.disagg_df.dtypes.drop(pid)
+        pandas.testing.assert_series_equal(observed, known)
+
+    def test_geometry(self):
+        assert isinstance(self.disagg_df, geopandas.GeoDataFrame)
+        known = self.df.geometry.repeat(self.df[cnt]).values
+        observed = self.disagg_df.geometry.values
+        assert shapely.equals(known, observed).all()
+
+    def test_index(self):
+        known = pandas.RangeIndex(12)
+        observed = self.disagg_df.index
+        pandas.testing.assert_index_equal(observed, known)
+
+
 class TestVitalsSynthLocs:
     @pytest.fixture(autouse=True)
     def setup_method(self, pnt_df_cnt, plg_df):
@@ -140,6 +343,212 @@ class TestVitalsGeneratePnts:
         assert pytest.approx(observed) == known
 
 
+class TestVitalsGeneratePntsBatch:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, plg_df):
+        self.polygon = plg_df.loc["B"].geometry
+        self.args = (25, self.polygon, 7, 0.5, 8, 10)
+
+    def test_respect(self, plg_df):
+        known = 0.4031967939355218
+        genpnts = likeness_vitals.sg_ops.generate_points(
+            2, plg_df.loc["A"].geometry, 1, 0.2, 2, 100, method="batch"
+        )
+        observed = genpnts[0].distance(genpnts[1])
+        assert pytest.approx(observed) == known
+
+    def test_equal_iterative(self):
+        known = likeness_vitals.sg_ops.generate_points(*self.args)
+        observed = likeness_vitals.sg_ops.generate_points(*self.args, method="batch")
+        assert shapely.equals(known, observed).all()
+
+    def test_no_separation(self):
+        known = likeness_vitals.sg_ops.generate_points(500, self.polygon, 3, 0, 0, 10)
+        observed = likeness_vitals.sg_ops.generate_points(
+            500, self.polygon, 3, 0, 0, 10, method="batch"
+        )
+        assert shapely.equals(known, observed).all()
+        assert shapely.contains(self.polygon, observed).all()
+
+
+class TestVitalsGeneratePntsTriangulation:
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        # long, thin diagonal polygon -- a poor fill of its bounding box
+        self.polygon = shapely.Polygon(((0, 0), (100, 100), (100, 101), (0, 1)))
+        self.args = (300, self.polygon, 2, 0.1, 200, 100)
+        self.genpnts = likeness_vitals.sg_ops.generate_points(
+            *self.args, method="triangulation"
+        )
+
+    def test_npoints_generated(self):
+        known = 300
+        observed = len(self.genpnts)
+        assert observed == known
+
+    def test_within(self):
+        assert shapely.contains(self.polygon, self.genpnts).all()
+
+    def test_reproducible(self):
+        observed = likeness_vitals.sg_ops.generate_points(
+            *self.args, method="triangulation"
+        )
+        assert shapely.equals(self.genpnts, observed).all()
+
+    def test_triangulation_cached(self):
+        cache_info = likeness_vitals.sg_ops._triangulate.cache_info
+        hits = cache_info().hits
+        likeness_vitals.sg_ops.generate_points(*self.args, method="triangulation")
+        assert cache_info().hits == hits + 1
+
+    def test_uniform(self):
+        square = shapely.Polygon(((0, 0), (0, 1), (1, 1), (1, 0), (0, 0)))
+        coords = shapely.get_coordinates(
+            likeness_vitals.sg_ops.generate_points(
+                20_000, square, 0, 0, 0, 1, method="triangulation"
+            )
+        )
+        observed = numpy.histogram2d(*coords.T, bins=2)[0] / 20_000
+        numpy.testing.assert_allclose(observed, 0.25, atol=0.02)
+
+    @pytest.mark.parametrize(
+        "scale, origin", [(1, (0, 0)), (1e-4, (-84, 35))], ids=["unit", "degrees"]
+    )
+    def test_uniform_clipped(self, monkeypatch, scale, origin):
+        """Delaunay triangulation clipped to a concave polygon (``shapely<2.1``)"""
+        monkeypatch.delattr(shapely, "constrained_delaunay_triangles", raising=False)
+        triangulate = likeness_vitals.sg_ops._triangulate
+        triangulate.cache_clear()
+
+        rng = numpy.random.default_rng(3)
+        theta, radii = (
+            numpy.sort(rng.uniform(0, 2 * numpy.pi, 12)),
+            rng.uniform(0.2, 1, 12),
+        )
+        polygon = shapely.Polygon(
+            numpy.c_[radii * numpy.cos(theta), radii * numpy.sin(theta)] * scale
+            + origin
+        )
+        triangles, _, clipped = triangulate(polygon)
+        assert clipped.any()
+        rings = numpy.concatenate([triangles, triangles[:, :1]], axis=1)[clipped]
+        region = shapely.intersection(
+            shapely.union_all(shapely.polygons(rings)), polygon
+        )
+
+        coords = likeness_vitals.sg_ops.generate_points(
+            20_000, polygon, 0, 0, 0, 1, method="triangulation", as_array=True
+        )
+        triangulate.cache_clear()
+        known = region.area / polygon.area
+        observed = shapely.contains_xy(region, *coords.T).mean()
+        assert observed == pytest.approx(known, abs=0.015)
+        assert shapely.intersects_xy(polygon, *coords.T).all()
+
+
+class TestVitalsGeneratePntsArray:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, plg_df):
+        self.args = (25, plg_df.loc["B"].geometry, 7, 0.5, 8, 10)
+
+    @pytest.mark.parametrize("method", likeness_vitals.sg_ops.METHODS)
+    def test_as_array(self, method):
+        known = likeness_vitals.sg_ops.generate_points(*self.args, method=method)
+        observed = likeness_vitals.sg_ops.generate_points(
+            *self.args, method=method, as_array=True
+        )
+        assert observed.shape == (25, 2)
+        assert observed.dtype == numpy.float64
+        numpy.testing.assert_array_equal(observed, shapely.get_coordinates(known))
+
+    def test_float32(self):
+        observed = likeness_vitals.sg_ops.generate_points(
+            *self.args, method="batch", as_array=True, dtype="float32"
+        )
+        assert observed.dtype == numpy.float32
+
+
+class TestVitalsGeneratePntsSeparation:
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        self.minsep = 1
+        self.maxsep = 40
+        polygon = shapely.Polygon(((0, 0), (0, 30), (30, 30), (30, 0), (0, 0)))
+        self.coords = shapely.get_coordinates(
+            likeness_vitals.sg_ops.generate_points(
+                200, polygon, 5, self.minsep, self.maxsep, 10_000, method="batch"
+            )
+        )
+        self.dists = scipy.spatial.distance.pdist(self.coords)
+
+    def test_minsep(self):
+        assert self.dists.min() >= self.minsep
+
+    def test_maxsep(self):
+        assert self.dists.max() <= self.maxsep
+
+
+class TestVitalsGeneratePntsPoisson:
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        self.minsep = 1
+        self.maxsep = 50
+        self.polygon = shapely.Polygon(((0, 0), (0, 20), (20, 20), (20, 0), (0, 0)))
+        self.args = (self.polygon, 3, self.minsep, self.maxsep, 1)
+
+    def test_minsep(self):
+        genpnts, nrelaxed = likeness_vitals.sg_ops.generate_points(
+            200, *self.args, method="poisson", return_relaxed=True
+        )
+        dists = scipy.spatial.distance.pdist(shapely.get_coordinates(genpnts))
+        assert len(genpnts) == 200
+        assert shapely.contains(self.polygon, genpnts).all()
+        assert dists.min() >= self.minsep
+        assert nrelaxed == 0
+
+    def test_saturated(self):
+        # far more points than fit within the polygon at ``minsep``
+        genpnts, nrelaxed = likeness_vitals.sg_ops.generate_points(
+            1_000, *self.args, method="poisson", return_relaxed=True
+        )
+        assert len(genpnts) == 1_000
+        assert shapely.contains(self.polygon, genpnts).all()
+        assert 0 < nrelaxed < 1_000
+
+    def test_reproducible(self):
+        known = likeness_vitals.sg_ops.generate_points(50, *self.args, method="poisson")
+        observed = likeness_vitals.sg_ops.generate_points(
+            50, *self.args, method="poisson"
+        )
+        assert shapely.equals(known, observed).all()
+
+    def test_relaxed_iterative(self):
+        _, nrelaxed = likeness_vitals.sg_ops.generate_points(
+            10, self.polygon, 3, self.minsep, self.maxsep, 100, return_relaxed=True
+        )
+        assert nrelaxed == 0
+
+    def test_multipolygon(self):
+        multipolygon = shapely.MultiPolygon(
+            [shapely.box(0, 0, 30, 100), shapely.box(50, 0, 60, 100)]
+        )
+        genpnts = likeness_vitals.sg_ops.generate_points(
+            400, multipolygon, 3, self.minsep, 100, 1, method="poisson"
+        )
+        dists = scipy.spatial.distance.pdist(shapely.get_coordinates(genpnts))
+        assert dists.min() >= self.minsep
+
+        known = [300, 100]
+        observed = [shapely.contains(p, genpnts).sum() for p in multipolygon.geoms]
+        assert known == observed
+
+    @pytest.mark.parametrize("method", likeness_vitals.sg_ops.METHODS)
+    def test_no_points(self, method):
+        known = []
+        observed = likeness_vitals.sg_ops.generate_points(0, *self.args, method=method)
+        assert known == observed
+
+
 class TestVitalsPointGenErrors:
     def test_maxsep_lt_minsep_error(self):
         minsep = 10
@@ -168,6 +577,165 @@ class TestVitalsPointGenErrors:
         ):
             likeness_vitals.sg_ops.generate_points(None, None, None, 10, 10, maxiter)
 
+    def test_method_error(self):
+        method = "magic"
+        with pytest.raises(ValueError, match=f"must be one of .*: {method}."):
+            likeness_vitals.sg_ops.generate_points(
+                None, None, None, 10, 10, 10, method=method
+            )
+
+
+class TestVitalsSynthLocsOrder:
+    def test_input_order(self, pnt_df, plg_df):
+        known = likeness_vitals.sg_ops.synthetic_locations(pnt_df, plg_df, gid)
+        shuffled = pnt_df.iloc[[3, 0, 4, 1, 5, 2]]
+        observed = likeness_vitals.sg_ops.synthetic_locations(shuffled, plg_df, gid)
+        assert observed.index.equals(shuffled.index)
+        geopandas.testing.assert_geodataframe_equal(observed.sort_index(), known)
+
+    def test_missing_polygon_error(self, pnt_df, plg_df):
+        with pytest.raises(KeyError, match="Polygons not found for: \\['B'\\]"):
+            likeness_vitals.sg_ops.synthetic_locations(pnt_df, plg_df.loc[["A"]], gid)
+
+
+class TestVitalsSynthLocsSpans:
+    def test_spans(self, pnt_df, plg_df, monkeypatch):
+        tracer = likeness_vitals.vitals.Tracer()
+        monkeypatch.setattr(likeness_vitals.vitals, "tracer", tracer)
+        likeness_vitals.sg_ops.synthetic_locations(pnt_df, plg_df, gid)
+        spans = tracer.to_frame()
+        root = spans.index[spans["name"] == "synthetic_locations"][0]
+
+        known = {
+            "synthetic_locations": 6,
+            "synthetic_locations.tasks": 2,
+            "synthetic_locations.points": 6,
+            "synthetic_locations.assemble": 6,
+        }
+        observed = dict(zip(spans["name"], spans["rows"], strict=True))
+        assert known == observed
+
+        known = {root}
+        observed = set(spans["parent_id"].drop(root))
+        assert known == observed
+
+
+class TestVitalsSynthLocsTriangulation:
+    def test_within(self, pnt_df, plg_df):
+        synthlocs_df = likeness_vitals.sg_ops.synthetic_locations(
+            pnt_df, plg_df, gid, minsep=0.2, maxsep=2, method="triangulation"
+        )
+        polygons = plg_df.geometry.loc[synthlocs_df[gid]].values
+        assert shapely.contains(polygons, synthlocs_df.geometry.values).all()
+
+
+class TestVitalsSynthLocsParallel:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, pnt_df, plg_df):
+        self.args = (pnt_df, plg_df, gid)
+        self.kws = {"minsep": 0.2, "maxsep": 2, "method": "batch"}
+        self.known = likeness_vitals.sg_ops.synthetic_locations(*self.args, **self.kws)
+
+    def test_n_jobs(self):
+        observed = likeness_vitals.sg_ops.synthetic_locations(
+            *self.args, n_jobs=2, **self.kws
+        )
+        geopandas.testing.assert_geodataframe_equal(observed, self.known)
+
+    def test_executor(self):
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            observed = likeness_vitals.sg_ops.synthetic_locations(
+                *self.args, executor=executor, **self.kws
+            )
+        geopandas.testing.assert_geodataframe_equal(observed, self.known)
+
+    def test_executor_n_jobs(self, monkeypatch):
+        class InlineExecutor(concurrent.futures.Executor):
+            """executor without a worker count attribute"""
+
+            def submit(self, fn, *args, **kwargs):
+                future = concurrent.futures.Future()
+                future.set_result(fn(*args, **kwargs))
+                return future
+
+        nchunks = []
+        balanced_chunks = likeness_vitals.sg_ops._balanced_chunks
+        monkeypatch.setattr(
+            likeness_vitals.sg_ops,
+            "_balanced_chunks",
+            lambda sizes, n: nchunks.append(n) or balanced_chunks(sizes, n),
+        )
+        observed = likeness_vitals.sg_ops.synthetic_locations(
+            *self.args, n_jobs=3, executor=InlineExecutor(), **self.kws
+        )
+        geopandas.testing.assert_geodataframe_equal(observed, self.known)
+
+        known = [3 * likeness_vitals.sg_ops._CHUNKS_PER_WORKER]
+        observed = nchunks
+        assert known == observed
+
+
+class TestVitalsSynthLocsSeedByID:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, plg_df):
+        self.kws = {"minsep": 0.2, "maxsep": 2, "seed_by_id": True}
+        self.plg_df = plg_df
+
+    def test_subset(self, pnt_df):
+        known = likeness_vitals.sg_ops.synthetic_locations(
+            pnt_df, self.plg_df, gid, **self.kws
+        )
+        observed = likeness_vitals.sg_ops.synthetic_locations(
+            pnt_df[pnt_df[gid] == "B"], self.plg_df, gid, **self.kws
+        )
+        assert shapely.equals(known.geometry[3:], observed.geometry).all()
+
+    def test_order(self, pnt_df):
+        known = likeness_vitals.sg_ops.synthetic_locations(
+            pnt_df, self.plg_df, gid, **self.kws
+        )
+        observed = likeness_vitals.sg_ops.synthetic_locations(
+            pnt_df.replace({gid: {"A": "C"}}),
+            self.plg_df.rename(index={"A": "C"}),
+            gid,
+            **self.kws,
+        )
+        assert shapely.equals(known.geometry[3:], observed.geometry[3:]).all()
+
+
+class TestVitalsIterSynthLocs:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, pnt_df, plg_df):
+        self.args = (pnt_df, plg_df, gid)
+        self.kws = {"minsep": 0.2, "maxsep": 2}
+        self.known = likeness_vitals.sg_ops.synthetic_locations(*self.args, **self.kws)
+
+    @pytest.mark.parametrize(
+        "chunksize, chunk_by, sizes",
+        [(2, "rows", [2, 1, 2, 1]), (4, "rows", [3, 3]), (1, "polygons", [3, 3])],
+    )
+    def test_chunks(self, chunksize, chunk_by, sizes):
+        chunks = list(
+            likeness_vitals.sg_ops.iter_synthetic_locations(
+                *self.args, chunksize=chunksize, chunk_by=chunk_by, **self.kws
+            )
+        )
+        assert [chunk.shape[0] for chunk in chunks] == sizes
+        observed = pandas.concat(chunks)
+        geopandas.testing.assert_geodataframe_equal(observed, self.known)
+
+    def test_chunksize_error(self):
+        with pytest.raises(ValueError, match="``chunksize`` must be 1 or greater"):
+            next(likeness_vitals.sg_ops.iter_synthetic_locations(*self.args, 0))
+
+    def test_chunk_by_error(self):
+        with pytest.raises(ValueError, match="``chunk_by`` must be 'rows' or"):
+            next(
+                likeness_vitals.sg_ops.iter_synthetic_locations(
+                    *self.args, chunk_by="blocks"
+                )
+            )
+
 
 class TestVitalsSynthLocErrors:
     def test_maxsep_lt_minsep_error(self):
@@ -1,43 +1,442 @@
 """Shared utility functionality for Likeness modules"""
 
+import collections
+import contextvars
+import itertools
+import json
+import logging
+import os
 import pathlib
+import threading
 import time
 import uuid
 import warnings
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from functools import wraps
 from typing import Any
 
 import geopandas
+import numpy
 import pandas
 import tqdm
 from tqdm.auto import tqdm as tqdm_auto
 
+DUPLICATES = ("last", "first", "error", "aggregate")
+HASH_BITS = (64, 128)
+_HASH_KEY_128 = "likeness_vitals1"
+_HASH_SALT_128 = numpy.uint64(0x9E3779B97F4A7C15)
 
-def function_timer(wrapped_function: callable) -> callable:
-    """This can be used as a wrapper. For example:
+
+class TimingRegistry:
+    """In-process registry of function call timings. Elapsed nanoseconds are
+    appended to a per-function buffer (cheap enough for hot functions) and
+    periodically folded into the call count, total, min, max, and a
+    histogram with power-of-2 nanosecond bins from which percentiles are
+    estimated. Memory is bounded per function regardless of the number
+    of calls.
+
+    Parameters
+    ----------
+    percentiles : tuple (default (50, 90, 99))
+        Percentiles (between 0 and 100) estimated in summaries.
+    buffer_size : int (default 4096)
+        Number of buffered timings per function before folding.
+    """
+
+    def __init__(self, percentiles: tuple = (50, 90, 99), buffer_size: int = 4096):
+        if any(not 0 <= q <= 100 for q in percentiles):
+            raise ValueError(f"``percentiles`` must be in [0, 100]: {percentiles}.")
+        self.percentiles = percentiles
+        self.buffer_size = buffer_size
+        self._buffers = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, elapsed_ns: int):
+        """Record an elapsed time in nanoseconds for ``name``."""
+        buffer = self._buffers.get(name)
+        if buffer is None:
+            buffer = self._buffers.setdefault(name, [])
+        buffer.append(elapsed_ns)
+        if len(buffer) >= self.buffer_size:
+            self._fold(name)
+
+    def _fold(self, name: str):
+        """Fold buffered timings of ``name`` into its statistics."""
+        with self._lock:
+            buffer = self._buffers[name]
+            elapsed = numpy.array(buffer[:], dtype=numpy.int64)
+            # only drop folded timings -- others may have been appended since
+            del buffer[: elapsed.size]
+            if not elapsed.size:
+                return
+
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = {
+                    "count": 0,
+                    "total": 0,
+                    "min": elapsed.min(),
+                    "max": elapsed.max(),
+                    "hist": numpy.zeros(64, dtype=numpy.int64),
+                }
+            stats["count"] += elapsed.size
+            stats["total"] += int(elapsed.sum())
+            stats["min"] = min(stats["min"], elapsed.min())
+            stats["max"] = max(stats["max"], elapsed.max())
+            # bin of ``elapsed.bit_length()``
+            bins = numpy.zeros(elapsed.size, dtype=numpy.int64)
+            positive = elapsed > 0
+            bins[positive] = numpy.log2(elapsed[positive]).astype(numpy.int64) + 1
+            stats["hist"] += numpy.bincount(bins, minlength=64)[:64]
+
+    def reset(self):
+        """Clear all records."""
+        with self._lock:
+            for buffer in self._buffers.values():
+                buffer.clear()
+            self._stats.clear()
+
+    def summary(self) -> pandas.DataFrame:
+        """Timing statistics (in seconds) per function.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Call ``count``, ``total``, ``mean``, ``min``, ``max``, and
+            estimated percentiles (e.g., ``p50``) indexed by ``function``.
+        """
+
+        for name in list(self._buffers):
+            self._fold(name)
+
+        rows = []
+        with self._lock:
+            for name, stats in self._stats.items():
+                count, total = stats["count"], stats["total"]
+                row = {"function": name, "count": count, "total": total}
+                row.update({"mean": total / count, "min": stats["min"]})
+                row["max"] = stats["max"]
+                for q in self.percentiles:
+                    row[f"p{q}"] = _hist_percentile(
+                        stats["hist"], q, stats["min"], stats["max"]
+                    )
+                rows.append(row)
+
+        columns = ["function", "count", "total", "mean", "min", "max"]
+        columns += [f"p{q}" for q in self.percentiles]
+        summary = pandas.DataFrame(rows, columns=columns).set_index("function")
+        summary[columns[2:]] = summary[columns[2:]].astype(float) / 1e9
+        return summary
+
+    def to_json(self, path: None | str | pathlib.Path = None) -> None | str:
+        """Export the summary as JSON records keyed by function. Returns the
+        JSON string if ``path`` is ``None``."""
+        return self.summary().to_json(path, orient="index")
+
+    def to_csv(self, path: None | str | pathlib.Path = None) -> None | str:
+        """Export the summary as CSV. Returns the CSV string if ``path`` is
+        ``None``."""
+        return self.summary().to_csv(path)
+
+    def log(self, logger: None | logging.Logger = None, level: int = logging.INFO):
+        """Emit one summary line per function to ``logger`` (default is the
+        ``likeness_vitals.vitals`` logger)."""
+        logger = _logger if logger is None else logger
+        for name, stats in self.summary().iterrows():
+            fields = " ".join(f"{k}={v:.6g}" for k, v in stats.items())
+            logger.log(level, "timing %s %s", name, fields)
+
+
+def _hist_percentile(hist: numpy.ndarray, q: float, _min: int, _max: int) -> float:
+    """Estimate a percentile from a power-of-2 bin histogram, interpolating
+    linearly within the bin and clipping to the observed range."""
+
+    # the target of ``q=0`` can fall on an empty bin
+    if q <= 0:
+        return float(_min)
+    cumulative = numpy.cumsum(hist)
+    target = q / 100 * cumulative[-1]
+    b = int(numpy.searchsorted(cumulative, target))
+    lower, upper = (1 << b - 1 if b else 0), 1 << b
+    below = cumulative[b - 1] if b else 0
+    frac = (target - below) / hist[b]
+    return float(min(max(lower + frac * (upper - lower), _min), _max))
+
+
+timings = TimingRegistry()
+_logger = logging.getLogger(__name__)
+
+
+def function_timer(
+    wrapped_function: None | Callable = None,
+    *,
+    name: None | str = None,
+    verbose: bool = False,
+    registry: None | TimingRegistry = None,
+) -> Callable:
+    """Record the elapsed time of each call in a ``TimingRegistry``
+    (``vitals.timings`` by default). This can be used as a wrapper with or
+    without arguments. For example:
 
         ```
         @function_timer
         def some_func(x):
             return x**2
+
+        @function_timer(verbose=True)
+        def other_func(x):
+            return x**3
+
+        vitals.timings.summary()
         ```
 
-    This will print the elapsed time in minutes.
+    Each call is also logged at ``DEBUG`` level to the
+    ``likeness_vitals.vitals`` logger.
+
+    Parameters
+    ----------
+    wrapped_function : None | Callable (default None)
+        Function to time.
+    name : None | str (default None)
+        Registry key. Defaults to the qualified name of the function.
+    verbose : bool (default False)
+        Print the elapsed time in minutes.
+    registry : None | TimingRegistry (default None)
+        Registry in which to record timings. Defaults to ``vitals.timings``.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        fname = func.__name__
+        key = f"{func.__module__}.{func.__qualname__}" if name is None else name
+        record = (timings if registry is None else registry).record
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            t1 = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter_ns() - t1
+                record(key, elapsed)
+                if _logger.isEnabledFor(logging.DEBUG):
+                    _logger.debug("timing %s %d ns", key, elapsed)
+                if verbose:
+                    total = round(elapsed / 6e10, 5)
+                    print(f"\t{total} min. -- ``{fname}()``")
+
+        return wrapper
+
+    if wrapped_function is None:
+        return decorator
+    return decorator(wrapped_function)
+
+
+class Tracer:
+    """Collector of completed ``Span`` records -- nested timings of pipeline
+    stages with row counts -- for export as a table or as Chrome trace-event
+    JSON (viewable with ``chrome://tracing`` or https://ui.perfetto.dev).
+    Records are kept in a bounded buffer, oldest dropped first.
+
+    Parameters
+    ----------
+    enabled : bool (default True)
+        Record spans. When ``False`` spans are (nearly) free no-ops.
+    max_spans : int (default 100_000)
+        Maximum number of records kept.
+    """
+
+    def __init__(self, enabled: bool = True, max_spans: int = 100_000):
+        self.enabled = enabled
+        self._spans = collections.deque(maxlen=max_spans)
+        self._origin = time.perf_counter_ns()
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def reset(self):
+        """Clear all records."""
+        self._spans.clear()
+
+    def to_frame(self) -> pandas.DataFrame:
+        """Span records (times in seconds since the tracer was created).
+
+        Returns
+        -------
+        pandas.DataFrame
+            ``name``, ``parent_id``, ``start``, ``duration``, ``rows``,
+            ``pid``, ``thread``, and ``args`` indexed by ``span_id``.
+        """
+
+        columns = ["span_id", "parent_id", "name", "start", "duration"]
+        columns += ["rows", "pid", "thread", "args"]
+        records = pandas.DataFrame(list(self._spans), columns=columns)
+        records["start"] = (records["start"] - self._origin) / 1e9
+        records["duration"] = records["duration"] / 1e9
+        for c in ["parent_id", "rows"]:
+            records[c] = records[c].astype("Int64")
+        return records.set_index("span_id")
+
+    def to_chrome_trace(self, path: None | str | pathlib.Path = None) -> None | str:
+        """Export records as Chrome trace-event JSON (complete events).
+        Returns the JSON string if ``path`` is ``None``."""
+
+        events = []
+        for span_id, parent_id, name, start, duration, rows, pid, tid, args in list(
+            self._spans
+        ):
+            event_args = {"span_id": span_id, "parent_id": parent_id}
+            if rows is not None:
+                event_args["rows"] = rows
+            event_args.update(args)
+            events.append(
+                {
+                    "name": name,
+                    "cat": "likeness_vitals",
+                    "ph": "X",
+                    "ts": (start - self._origin) / 1e3,
+                    "dur": duration / 1e3,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": event_args,
+                }
+            )
+
+        trace = json.dumps(
+            {"traceEvents": events, "displayTimeUnit": "ms"}, default=str
+        )
+        if path is None:
+            return trace
+        pathlib.Path(path).write_text(trace)
+
+
+tracer = Tracer()
+_current_span = contextvars.ContextVar("likeness_vitals_span", default=None)
+_span_ids = itertools.count(1)
 
+
+class Span:
+    """Timed stage of a pipeline, recorded in a ``Tracer`` on exit. Spans
+    opened within another span (in the same thread or task) are its
+    children. Use ``span()`` to create one.
+
+    Parameters
+    ----------
+    name : None | str
+        Stage name. Defaults to the qualified name of a decorated function.
+    rows : None | int (default None)
+        Number of rows processed in the stage -- can also be set within
+        the span with ``Span.rows``.
+    tracer : None | Tracer (default None)
+        Tracer in which to record. Defaults to ``vitals.tracer``.
+    **args
+        Extra attributes recorded with the span.
     """
 
-    @wraps(wrapped_function)
-    def wrapper(*args, **kwargs) -> Any:
-        fname = wrapped_function.__name__
-        t1 = time.time()
-        _wrapper = wrapped_function(*args, **kwargs)
-        t2 = time.time()
-        total = round((t2 - t1) / 60.0, 5)
-        print(f"\t{total} min. -- ``{fname}()``")
-        return _wrapper
+    __slots__ = ("name", "rows", "tracer", "args", "span_id", "_start", "_token")
+
+    def __init__(
+        self,
+        name: None | str,
+        rows: None | int = None,
+        tracer: None | Tracer = None,
+        **args,
+    ):
+        self.name = name
+        self.rows = rows
+        self.tracer = tracer
+        self.args = args
+        self.span_id = None
+        self._token = None
+
+    def __enter__(self) -> "Span":
+        if not (tracer if self.tracer is None else self.tracer).enabled:
+            return self
+        self.span_id = next(_span_ids)
+        self._token = _current_span.set(self)
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, *_) -> bool:
+        if self._token is None:
+            return False
+        end = time.perf_counter_ns()
+        parent = self._token.old_value
+        _current_span.reset(self._token)
+        self._token = None
+
+        args = self.args
+        if exc_type is not None:
+            args = {**args, "error": exc_type.__name__}
+        (tracer if self.tracer is None else self.tracer)._spans.append(
+            (
+                self.span_id,
+                parent.span_id if isinstance(parent, Span) else None,
+                self.name,
+                self._start,
+                end - self._start,
+                None if self.rows is None else int(self.rows),
+                os.getpid(),
+                threading.get_ident(),
+                args,
+            )
+        )
+        return False
+
+    def __call__(self, func: Callable) -> Callable:
+        name = (
+            f"{func.__module__}.{func.__qualname__}" if self.name is None else self.name
+        )
 
-    return wrapper
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            with Span(name, rows=self.rows, tracer=self.tracer, **self.args):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+
+def span(
+    name: None | str | Callable = None,
+    rows: None | int = None,
+    tracer: None | Tracer = None,
+    **args,
+) -> Span | Callable:
+    """Trace a pipeline stage as a context manager or decorator (with or
+    without arguments). For example:
+
+        ```
+        @span
+        def build_households(df):
+            ...
+
+        with span("persons", rows=len(df)) as s:
+            persons = build_persons(df)
+            s.rows = len(persons)
+
+        vitals.tracer.to_chrome_trace("trace.json")
+        ```
+
+    Parameters
+    ----------
+    name : None | str | Callable (default None)
+        Stage name. Defaults to the qualified name of a decorated function.
+    rows : None | int (default None)
+        Number of rows processed in the stage.
+    tracer : None | Tracer (default None)
+        Tracer in which to record. Defaults to ``vitals.tracer``.
+    **args
+        Extra attributes recorded with the span.
+
+    Returns
+    -------
+    Span | Callable
+        Span context manager, or the decorated function.
+    """
+
+    if callable(name):
+        return Span(None, rows=rows, tracer=tracer, **args)(name)
+    return Span(name, rows=rows, tracer=tracer, **args)
 
 
 def progress(iterable_object: Iterable, desc: str) -> tqdm.asyncio.tqdm_asyncio:
@@ -62,60 +461,379 @@ def progress(iterable_object: Iterable, desc: str) -> tqdm.asyncio.tqdm_asyncio:
 def match(
     x1: pandas.DataFrame | geopandas.GeoDataFrame,
     x2: pandas.Series | pandas.DataFrame | geopandas.GeoSeries | geopandas.GeoDataFrame,
-    on: None | str = None,
-    v: None | str = None,
-    strict: bool = False,
-) -> pandas.Series:
+    on: None | str | list = None,
+    v: None | str | list = None,
+    strict: bool = False,  # noqa: ARG001
+    duplicates: str = "last",
+    aggfunc: str | Callable = "sum",
+    return_unmatched: bool = False,
+) -> pandas.Series | pandas.DataFrame | tuple:
     """Matches values between DataFrames based on a common key.
 
     Parameters
     ----------
     x1 : pandas.DataFrame | geopandas.GeoDataFrame
-        Target data.
+        Target data. Also accepts an ``sg_ops.DisaggregatedView``.
     x2 : pandas.Series | pandas.DataFrame | geopandas.GeoSeries | geopandas.GeoDataFrame
         Source data.
-    on : str (default None)
+    on : str | list (default None)
         Common key between ``df1`` and ``df2``. If ``None``, the
-        ``df1`` index is used.
-    v : str (default None)
+        ``df1`` index is used. A list of columns is a composite key.
+    v : str | list (default None)
         Variable in ``df2`` whose values will be matched to ``df1``.
         If ``x2`` is a DataFrame, but v is not provided, defaults
-        to the first variable after ``on``.
+        to the first variable after ``on``. A list of variables is
+        matched with a single key resolution and returned as a DataFrame.
     strict : bool (default False)
-        Ensure zipped iterables are the same length.
+        Retained for backwards compatibility. Keys and values are taken
+        from the same source, so are always the same length.
+    duplicates : str (default 'last')
+        Policy for duplicate keys in ``df2``. See ``Matcher``.
+    aggfunc : str | callable (default 'sum')
+        Aggregation of duplicate key values when ``duplicates='aggregate'``.
+    return_unmatched : bool (default False)
+        Also return the number of ``df1`` keys not found in ``df2``.
 
     Returns
     -------
-    out : pandas.Series
-        Values of ``v`` in ``df2`` matched to ``df1``.
+    out : pandas.Series | pandas.DataFrame
+        Values of ``v`` in ``df2`` matched to ``df1``. Unmatched keys are
+        missing. Extension data types (e.g., categorical, geometry) of ``v``
+        are preserved.
+    nunmatched : int
+        Number of unmatched keys. Only returned if ``return_unmatched=True``.
     """
 
-    # type checking
-    pd_frame = isinstance(x2, pandas.DataFrame)
-    gpd_frame = isinstance(x2, geopandas.GeoDataFrame)
+    matcher = Matcher(x2, on=on, duplicates=duplicates, aggfunc=aggfunc)
+    return matcher(x1, v=v, return_unmatched=return_unmatched)
 
-    pd_series = isinstance(x2, pandas.Series)
-    gpd_series = isinstance(x2, geopandas.GeoSeries)
 
-    # create match contingency
-    if pd_frame or gpd_frame:
-        assert x2.shape[1] >= 2, "Source data must have at least two columns."
-        if v is None:
-            v = x2.columns[x2.columns != on][0]
-        val_match = dict(zip(x2[on], x2[v], strict=strict))
+class Matcher:
+    """Prebuilt lookup of source data values by a common key for repeated
+    matching against many targets. The key index is built once and reused by
+    each call. Matchers can be pickled (e.g., to ship to worker processes).
+    For example:
 
-    elif pd_series or gpd_series:
-        val_match = dict(zip(x2.index.values, x2.values, strict=strict))
+        ```
+        bg_match = Matcher(bg_attrs, on="bgid")
+        persons["income"] = bg_match(persons, v="income")
+        households["income"] = bg_match(households, v="income")
+        ```
 
+    Parameters
+    ----------
+    x2 : pandas.Series | pandas.DataFrame | geopandas.GeoSeries | geopandas.GeoDataFrame
+        Source data.
+    on : str | list (default None)
+        Common key between targets and ``x2``. If ``None``, the target
+        index is used. A list of columns is a composite key. If ``x2`` is
+        a Series, its index (or MultiIndex) holds the keys.
+    duplicates : str (default 'last')
+        Policy for duplicate keys in ``x2``, applied while the key index
+        is built. Either match the ``'last'`` or ``'first'`` value of
+        the duplicate key, raise an ``'error'``, or ``'aggregate'`` the
+        values of each key with ``aggfunc``.
+    aggfunc : str | callable (default 'sum')
+        Aggregation of duplicate key values (see ``pandas.DataFrame.agg``).
+        Only used when ``duplicates='aggregate'``.
+    """
+
+    def __init__(
+        self,
+        x2: pandas.Series
+        | pandas.DataFrame
+        | geopandas.GeoSeries
+        | geopandas.GeoDataFrame,
+        on: None | str | list = None,
+        duplicates: str = "last",
+        aggfunc: str | Callable = "sum",
+    ):
+        if duplicates not in DUPLICATES:
+            raise ValueError(
+                f"``duplicates`` must be one of {DUPLICATES}: {duplicates}."
+            )
+
+        # type checking
+        pd_frame = isinstance(x2, pandas.DataFrame)
+        gpd_frame = isinstance(x2, geopandas.GeoDataFrame)
+
+        pd_series = isinstance(x2, pandas.Series)
+        gpd_series = isinstance(x2, geopandas.GeoSeries)
+
+        # create match contingency
+        if pd_frame or gpd_frame:
+            assert x2.shape[1] >= 2, "Source data must have at least two columns."
+            keys = self._keys(x2, on)
+
+        elif pd_series or gpd_series:
+            keys = x2.index
+
+        else:
+            raise TypeError(f"{type(x2)} not supported for ``x2``.")
+
+        # resolve duplicate keys -- a single hashing pass over the keys
+        rows = None
+        if duplicates == "aggregate":
+            codes, uniques = keys.factorize(use_na_sentinel=False)
+            if len(uniques) < len(keys):
+                if pd_frame or gpd_frame:
+                    on_cols = [on] if isinstance(on, str) else list(on)
+                    x2 = x2.drop(columns=on_cols)
+                x2 = x2.groupby(codes, sort=False).agg(aggfunc)
+                keys = uniques
+        else:
+            keep = "first" if duplicates == "first" else "last"
+            dups = keys.duplicated(keep=keep)
+            if dups.any():
+                if duplicates == "error":
+                    dupkeys = keys[dups].unique().tolist()
+                    raise ValueError(f"Duplicate keys found in ``x2``: {dupkeys}")
+                rows = numpy.flatnonzero(~dups)
+                keys = keys[rows]
+
+        self.obj = x2
+        self.on = on
+        self.keys = keys
+        self.rows = rows
+
+    @staticmethod
+    def _keys(x: pandas.DataFrame, on: str | list) -> pandas.Index:
+        """Key (or composite key) index of ``x``."""
+        if isinstance(on, str):
+            return pandas.Index(x[on])
+        return pandas.MultiIndex.from_frame(x[list(on)])
+
+    def __call__(
+        self,
+        x1: pandas.DataFrame | geopandas.GeoDataFrame,
+        v: None | str | list = None,
+        return_unmatched: bool = False,
+    ) -> pandas.Series | pandas.Index | pandas.DataFrame | tuple:
+        """Match values of the source data to a target.
+
+        Parameters
+        ----------
+        x1 : pandas.DataFrame | geopandas.GeoDataFrame
+            Target data. Also accepts an ``sg_ops.DisaggregatedView``.
+        v : str | list (default None)
+            Variable in the source data whose values will be matched to
+            ``x1``. If the source data is a DataFrame, but v is not provided,
+            defaults to the first variable after ``on``. A list of variables
+            is matched with a single key resolution.
+        return_unmatched : bool (default False)
+            Also return the number of ``x1`` keys not found in the source.
+
+        Returns
+        -------
+        out : pandas.Series | pandas.Index | pandas.DataFrame
+            Values of ``v`` matched to ``x1`` -- an Index when matched on the
+            ``x1`` index or a DataFrame when ``v`` is a list. Unmatched keys
+            are missing.
+        nunmatched : int
+            Number of unmatched keys. Only returned if ``return_unmatched``.
+        """
+
+        frame = isinstance(self.obj, pandas.DataFrame)
+        if frame and v is None:
+            on = [self.on] if isinstance(self.on, str) else self.on or []
+            v = self.obj.columns[~self.obj.columns.isin(on)][0]
+
+        # resolve keys once -- unmatched keys (``-1``) are missing
+        if self.on is None:
+            target = x1.index
+        elif isinstance(self.on, str):
+            target = x1[self.on]
+        else:
+            target = self._keys(x1, self.on)
+        indexer = self.keys.get_indexer(target)
+        if self.rows is not None:
+            indexer = numpy.where(indexer >= 0, self.rows[indexer], -1)
+
+        def _take(vals: Any) -> Any:
+            return pandas.api.extensions.take(vals, indexer, allow_fill=True)
+
+        index = x1.index
+        if isinstance(v, list):
+            out = pandas.DataFrame(
+                {c: _take(self.obj[c].array) for c in v}, index=index
+            )
+        else:
+            vals = _take(self.obj[v].array if frame else self.obj.array)
+            if self.on is None:
+                out = pandas.Index(vals, name=target.name)
+            else:
+                name = target.name if isinstance(self.on, str) else None
+                out = pandas.Series(vals, index=index, name=name)
+
+        if return_unmatched:
+            return out, int(numpy.count_nonzero(indexer < 0))
+        return out
+
+
+def _hash_groups(
+    df: pandas.DataFrame, hashes: None | numpy.ndarray = None
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Group identical rows by a vectorized 64-bit row hash.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Rows to group.
+    hashes : None | numpy.ndarray (default None)
+        Precomputed row hashes (e.g., 128-bit as ``bytes``). If ``None``,
+        64-bit hashes are computed with ``pandas.util.hash_pandas_object``.
+
+    Returns
+    -------
+    codes : numpy.ndarray
+        Group of each row, in order of first appearance.
+    first : numpy.ndarray
+        Position of the first row of each group.
+    """
+
+    if hashes is None:
+        hashes = pandas.util.hash_pandas_object(df, index=False).to_numpy()
+    codes, _ = pandas.factorize(hashes)
+    _, first = numpy.unique(codes, return_index=True)
+
+    # hash collisions -- rows differing from the first row sharing their hash;
+    # values are compared by factorized codes, so missing values (incl.
+    # ``pandas.NA``) equal each other
+    reps = first[codes]
+    for c in df.columns:
+        values, _ = pandas.factorize(df[c])
+        if not (values == values[reps]).all():
+            raise ValueError(f"Row hash collision detected in ``{c}``.")
+
+    return codes, first
+
+
+def _bulk_uuids(
+    n: int, version: int = 4, seed: None | int = None, binary: bool = False
+) -> numpy.ndarray:
+    """Vectorized generation of version 4 or 7 UUIDs.
+
+    Parameters
+    ----------
+    n : int
+        Number of UUIDs.
+    version : int (default 4)
+        UUID version -- ``4`` or ``7``.
+    seed : None | int (default None)
+        Random seed. If ``None``, bytes are drawn from ``os.urandom``. The
+        timestamp of version 7 UUIDs is always the current time.
+    binary : bool (default False)
+        Return 16-byte binary (``bytes``) rather than 32 character hex.
+
+    Returns
+    -------
+    numpy.ndarray
+        UUIDs as ``bytes`` or hex string values (``object``).
+    """
+
+    if version not in (4, 7):
+        raise ValueError(f"``uuid_version`` must be one of (1, 4, 7): {version}.")
+
+    if seed is None:
+        buf = numpy.frombuffer(os.urandom(16 * n), dtype=numpy.uint8)
     else:
-        raise TypeError(f"{type(x2)} not supported for ``x2``.")
+        buf = numpy.random.default_rng(seed).integers(0, 256, 16 * n, numpy.uint8)
+    buf = buf.reshape(n, 16).copy()
+
+    # version 7 -- big-endian 48-bit Unix millisecond timestamp
+    if version == 7:
+        ms = time.time_ns() // 1_000_000
+        buf[:, :6] = numpy.frombuffer(ms.to_bytes(6, "big"), dtype=numpy.uint8)
 
-    # map values
-    out = x1[on].map(val_match) if on is not None else x1.index.map(val_match)
+    # version & RFC 9562 variant bits
+    buf[:, 6] = (buf[:, 6] & 0x0F) | (version << 4)
+    buf[:, 8] = (buf[:, 8] & 0x3F) | 0x80
 
+    if binary:
+        return _bytes16(buf)
+    hexed = numpy.frombuffer(buf.tobytes().hex().encode("ascii"), dtype="S32")
+    return hexed.astype("U32").astype(object)
+
+
+def _bytes16(buf: numpy.ndarray) -> numpy.ndarray:
+    """Rows of 16 ``uint8`` as ``bytes`` (``object``). Unlike ``'S16'``, which
+    drops trailing null bytes when elements are read, all 16 bytes are kept.
+    """
+
+    out = numpy.empty(buf.shape[0], dtype=object)
+    out[:] = buf.view("V16").ravel().tolist()
     return out
 
 
+def _hash_ids(df: pandas.DataFrame, hash_bits: int = 64) -> numpy.ndarray:
+    """Deterministic content-hash IDs of rows.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Rows to hash.
+    hash_bits : int (default 64)
+        Either 64-bit (``uint64``) or 128-bit (16-byte ``bytes``) IDs.
+
+    Returns
+    -------
+    ids : numpy.ndarray
+        Row IDs -- identical rows share an ID.
+    """
+
+    if hash_bits not in HASH_BITS:
+        raise ValueError(f"``hash_bits`` must be one of {HASH_BITS}: {hash_bits}.")
+
+    ids = pandas.util.hash_pandas_object(df, index=False).to_numpy()
+    if hash_bits == 128:
+        # second 64-bit hash -- ``hash_key`` only applies to string & object
+        # columns, so each column hash is also salted and rehashed before the
+        # columns are combined; stored big-endian
+        salted = {
+            c: pandas.util.hash_pandas_object(
+                df[c], index=False, hash_key=_HASH_KEY_128
+            ).to_numpy()
+            ^ _HASH_SALT_128
+            for c in df.columns
+        }
+        ids_b = pandas.util.hash_pandas_object(
+            pandas.DataFrame(salted), index=False
+        ).to_numpy()
+        ids = numpy.column_stack((ids, ids_b)).astype(">u8").view(numpy.uint8)
+        ids = _bytes16(ids)
+
+    # raises on hash collisions between rows differing in content
+    _hash_groups(df, hashes=ids)
+
+    return ids
+
+
+def _concat_str(components: list, sep: str) -> numpy.ndarray:
+    """Vectorized, column-wise concatenation of string representations. Each
+    unique value is converted with ``str()`` (e.g., missing values as
+    ``'nan'``) and the strings are concatenated with pandas string kernels.
+
+    Parameters
+    ----------
+    components : list
+        Equal length arrays of values to concatenate.
+    sep : str
+        Separator between components.
+
+    Returns
+    -------
+    numpy.ndarray
+        Concatenated strings (``object`` dtype).
+    """
+
+    strings = []
+    for values in components:
+        codes, uniques = pandas.factorize(values, use_na_sentinel=False)
+        labels = numpy.array([str(u) for u in uniques], dtype=object)
+        strings.append(pandas.Series(labels[codes], dtype=object))
+    return strings[0].str.cat(strings[1:], sep=sep).to_numpy(dtype=object)
+
+
 def get_censusapikey(path: str | pathlib.Path = "") -> str:
     """Fetch your Census API key. See README.md for more details.
 
@@ -160,6 +878,10 @@ def create_uid(
     set_index: bool = False,
     drop_cols: bool = False,
     breaker: str = "_",
+    uuid_version: int = 4,
+    seed: None | int = None,
+    binary: bool = False,
+    hash_bits: None | int = None,
 ) -> pandas.DataFrame | geopandas.GeoDataFrame:
     """Generate a unique identifying ID.
 
@@ -170,7 +892,7 @@ def create_uid(
     id_name : str
         Name of the new ID.
         * set to ``'uuid'`` to generate a Universally Unique Identifier
-        with the ``uuid.uuid1().hex`` algorithm. See *Notes* below.
+        (as 32 character hex). See ``uuid_version`` and *Notes* below.
     use_index : bool (default False)
         Include the original index values in the new unique ID.
     from_columns : list | None (default (None)
@@ -181,6 +903,23 @@ def create_uid(
         Drop intermediary columns if ``from_columns`` is specified.
     breaker : str (default '_')
         Break up components of the unique ID if ``from_columns`` is specified.
+    uuid_version : int (default 4)
+        UUID version when ``id_name='uuid'``. Versions ``4`` (random) and
+        ``7`` (Unix millisecond timestamp + random) are generated in bulk.
+        Version ``1`` is the legacy per-row ``uuid.uuid1().hex`` algorithm.
+    seed : None | int (default None)
+        Random seed for the random bytes of version 4 & 7 UUIDs. If ``None``,
+        random bytes are drawn from the operating system. Only version 4
+        UUIDs are reproducible -- version 7 UUIDs embed the current time.
+    binary : bool (default False)
+        Store version 4 & 7 UUIDs as 16-byte binary (``bytes``, e.g., for
+        ``uuid.UUID(bytes=...)``) rather than hex strings.
+    hash_bits : None | int (default None)
+        Create a deterministic content-hash ID of ``from_columns`` (and the
+        index if ``use_index``) rather than a concatenation -- either
+        64-bit (``uint64``) or 128-bit (16-byte binary, ``bytes``). IDs are
+        identical across reruns and a ``ValueError`` is raised if differing
+        rows collide.
 
     Returns
     -------
@@ -189,13 +928,11 @@ def create_uid(
 
     Notes
     -----
-    See https://docs.python.org/3/library/uuid.html#uuid.uuid1
+    See https://docs.python.org/3/library/uuid.html and
+    https://www.rfc-editor.org/rfc/rfc9562. Version 1 UUIDs embed the
+    host MAC address.
     """
 
-    def _idx_generator(ix: int) -> str:
-        """concatenate specified column values."""
-        return breaker.join([str(df.loc[ix, c]) for c in from_columns])
-
     if not set_index and drop_cols:
         raise RuntimeError(
             f"``set_index``=={set_index} and"
@@ -206,32 +943,42 @@ def create_uid(
     generate_uuid = False
     if id_name.lower() == "uuid":
         generate_uuid = True
-        unique_id = [uuid.uuid1().hex for _ in df.index]
+        if uuid_version == 1:
+            if seed is not None or binary:
+                raise ValueError(
+                    "``seed`` and ``binary`` are not supported for ``uuid_version=1``."
+                )
+            unique_id = [uuid.uuid1().hex for _ in df.index]
+        else:
+            unique_id = _bulk_uuids(
+                df.shape[0], version=uuid_version, seed=seed, binary=binary
+            )
 
     # or create an ID based on other variable values
     if not generate_uuid:
         if isinstance(from_columns, str):
             from_columns = [from_columns]
+        from_columns = list(from_columns or [])
 
+        # ID components -- original index values come last
+        components = [df[c].array for c in from_columns]
         if use_index:
-            orig_index = df.index.copy()
-            index_name = "index" if not df.index.name else df.index.name
-            df.reset_index(inplace=True)
-            from_columns += [index_name]
-
-        if len(from_columns) > 1:
-            unique_id = df.index.map(_idx_generator)
+            components.append(df.index.array)
+
+        if hash_bits is not None:
+            frame = pandas.DataFrame(dict(enumerate(components)))
+            index_name = ["index" if not df.index.name else df.index.name]
+            frame.columns = from_columns + (index_name if use_index else [])
+            unique_id = _hash_ids(frame, hash_bits=hash_bits)
+        elif len(components) > 1:
+            unique_id = _concat_str(components, breaker)
         else:
-            unique_id = df[from_columns]
-
-        if use_index:
-            df.index = orig_index
-            df.drop(columns=index_name, inplace=True)
-            from_columns.pop()
+            unique_id = components[0]
 
         if drop_cols:
             df.drop(columns=from_columns, inplace=True)
 
+    # arrays are assigned by position -- no alignment on (duplicate) labels
     df[id_name] = unique_id
 
     if set_index: